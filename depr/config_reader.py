@@ -1,48 +1,180 @@
 # -*- coding: utf-8 -*-
 """
-Config Reader Module - A utility for reading configuration from environment variables and YAML files
+Config Reader Module - A utility for reading configuration from environment variables and YAML/INI files
 """
 import os
-import yaml
-from typing import Any, Dict, Optional, List, Union
-from dotenv import load_dotenv
+import json
+from typing import Any, Dict, Optional, List, Literal, Union
+
+# Resolved on first YAML load so env-only usage never imports PyYAML
+_yaml_loader = None
+
+
+def _get_yaml_loader():
+    """Return the libyaml C loader when PyYAML was built with it, else SafeLoader."""
+    global _yaml_loader
+    if _yaml_loader is None:
+        import yaml
+        _yaml_loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+        if _yaml_loader is yaml.SafeLoader:
+            print("Warning: libyaml not available, falling back to the pure-Python YAML loader")
+    return _yaml_loader
+
+
+class ConfigParseError(ValueError):
+    """Raised by a config backend when the file contents cannot be parsed."""
+
+
+class _YamlBackend:
+    """Load a YAML file into a nested dict."""
+    
+    def load(self, path: str) -> Dict[str, Any]:
+        import yaml
+        loader = _get_yaml_loader()
+        with open(path, 'r', encoding='utf-8') as file:
+            try:
+                return yaml.load(file, Loader=loader) or {}
+            except yaml.YAMLError as e:
+                raise ConfigParseError(f"Error parsing YAML file: {e}") from e
+
+
+class _IniBackend:
+    """Load an INI file into a {section: {key: value}} dict. Values stay strings."""
+    
+    def load(self, path: str) -> Dict[str, Any]:
+        import configparser
+        # Values are returned verbatim; '%' in passwords, URLs or log formats is not interpolation
+        parser = configparser.ConfigParser(interpolation=None)
+        try:
+            with open(path, 'r', encoding='utf-8') as file:
+                parser.read_file(file)
+            return {section: dict(parser[section]) for section in parser.sections()}
+        except configparser.Error as e:
+            raise ConfigParseError(f"Error parsing INI file: {e}") from e
+
+
+_BACKENDS = {
+    "yaml": _YamlBackend,
+    "ini": _IniBackend,
+}
+
+_INI_SUFFIXES = (".ini", ".cfg", ".conf")
+
 
 class ConfigReader:
     """
-    A utility class for reading configuration from environment variables and YAML files.
+    A utility class for reading configuration from environment variables and YAML/INI files.
     """
     
-    def __init__(self, env_path: Optional[str] = ".env", config_path: Optional[str] = "config.yaml"):
+    def __init__(
+        self,
+        env_path: Optional[str] = ".env",
+        config_path: Optional[str] = "config.yaml",
+        backend: Literal["auto", "yaml", "ini"] = "auto"
+    ):
         """
         Initialize the ConfigReader.
         
         Args:
             env_path: Path to the .env file. Set to None to skip loading .env file.
-            config_path: Path to the config.yaml file. Set to None to skip loading config file.
+            config_path: Path to the config file. Set to None to skip loading config file.
+            backend: Config file format. "auto" picks "ini" for .ini/.cfg/.conf
+                files and "yaml" for everything else.
         """
+        if backend == "auto":
+            is_ini = bool(config_path) and config_path.lower().endswith(_INI_SUFFIXES)
+            backend = "ini" if is_ini else "yaml"
+        if backend not in _BACKENDS:
+            raise ValueError(f"Unsupported config backend: {backend}")
+        
         self.config_data = {}
         self.config_path = config_path
+        self._backend_name = backend
+        self._backend = _BACKENDS[backend]()
+        self._env_cache: Dict[str, Optional[str]] = {}
         
         # Load environment variables if env_path is provided
         if env_path:
+            from dotenv import load_dotenv
             load_dotenv(env_path)
         
         # Load config file if config_path is provided
         if config_path and os.path.exists(config_path):
-            self._load_yaml_config()
+            self._load_config()
     
-    def _load_yaml_config(self):
-        """Load configuration from YAML file."""
+    def _load_config(self, use_cache: bool = True):
+        """
+        Load configuration from the config file using the selected backend.
+        
+        A JSON sidecar (<config_path>.cache.json) keyed by the backend and the
+        source mtime and size is used when up to date, so unchanged configs skip parsing entirely.
+        """
+        cache_path = f"{self.config_path}.cache.json"
         try:
-            with open(self.config_path, 'r', encoding='utf-8') as file:
-                self.config_data = yaml.safe_load(file) or {}
-        except yaml.YAMLError as e:
-            print(f"Error parsing YAML file: {e}")
+            stat = os.stat(self.config_path)
+        except OSError:
+            stat = None
+        
+        if use_cache and stat is not None:
+            cached = self._read_config_cache(cache_path, stat)
+            if cached is not None:
+                self.config_data = cached
+                return
+        
+        try:
+            self.config_data = self._backend.load(self.config_path)
+            if stat is not None:
+                self._write_config_cache(cache_path, stat)
+        except ConfigParseError as e:
+            print(e)
             self.config_data = {}
         except Exception as e:
             print(f"Error loading config file: {e}")
             self.config_data = {}
     
+    def _read_config_cache(self, cache_path: str, stat: os.stat_result) -> Optional[Dict[str, Any]]:
+        """Return the cached config if it matches the backend and source mtime and size, else None."""
+        try:
+            with open(cache_path, 'r', encoding='utf-8') as file:
+                cache = json.load(file)
+        except (OSError, ValueError):
+            return None
+        if not isinstance(cache, dict):
+            return None
+        # YAML and INI parse the same file differently; never serve one backend's result to the other
+        if cache.get("backend") != self._backend_name:
+            return None
+        # Size catches edits that land within the filesystem's mtime granularity
+        if cache.get("mtime_ns") != stat.st_mtime_ns or cache.get("size") != stat.st_size:
+            return None
+        return cache.get("data")
+    
+    def _write_config_cache(self, cache_path: str, stat: os.stat_result) -> None:
+        """Atomically write the parsed config to the JSON sidecar cache."""
+        try:
+            payload = json.dumps(
+                {
+                    "backend": self._backend_name,
+                    "mtime_ns": stat.st_mtime_ns,
+                    "size": stat.st_size,
+                    "data": self.config_data,
+                },
+                ensure_ascii=False,
+            )
+        except (TypeError, ValueError):
+            # Values like dates are not JSON-serializable; skip caching
+            return
+        # Non-string keys would not survive the JSON round trip; skip caching
+        if json.loads(payload)["data"] != self.config_data:
+            return
+        tmp_path = f"{cache_path}.tmp"
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as file:
+                file.write(payload)
+            os.replace(tmp_path, cache_path)
+        except OSError:
+            pass
+    
     def get_env(self, key: str, default: Any = None) -> Any:
         """
         Get a value from environment variables.
@@ -54,7 +186,11 @@ class ConfigReader:
         Returns:
             The value of the environment variable or the default
         """
-        return os.getenv(key, default)
+        try:
+            value = self._env_cache[key]
+        except KeyError:
+            value = self._env_cache[key] = os.environ.get(key)
+        return default if value is None else value
     
     def get_all_env(self, keys: List[str] = None) -> Dict[str, str]:
         """
@@ -70,11 +206,12 @@ class ConfigReader:
         if keys is None:
             return dict(os.environ)
         
-        return {key: os.getenv(key) for key in keys if os.getenv(key) is not None}
+        values = {key: self.get_env(key) for key in keys}
+        return {key: value for key, value in values.items() if value is not None}
     
     def get_config(self, *keys, default: Any = None) -> Any:
         """
-        Get a value from the config.yaml file with nested key support.
+        Get a value from the config file with nested key support.
         
         Args:
             *keys: Key path to access nested values (e.g., 'database', 'connection', 'host')
@@ -100,7 +237,7 @@ class ConfigReader:
         Get an entire section from the config file as a dictionary.
         
         Args:
-            section: The top-level key in the YAML file
+            section: The top-level key in the YAML file, or the INI section name
             
         Returns:
             Dictionary containing all nested values in the section
@@ -116,10 +253,19 @@ class ConfigReader:
         """
         return self.config_data
     
+    def invalidate_env_cache(self) -> None:
+        """
+        Clear cached environment variable lookups.
+        Call this after modifying os.environ so get_env sees the new values.
+        """
+        self._env_cache.clear()
+    
     def reload(self) -> None:
         """
-        Reload the configuration from the YAML file.
+        Reload the configuration from the config file.
         Useful when the file contents might have changed.
+        The JSON sidecar cache is bypassed and rewritten.
         """
+        self.invalidate_env_cache()
         if self.config_path and os.path.exists(self.config_path):
-            self._load_yaml_config()
+            self._load_config(use_cache=False)
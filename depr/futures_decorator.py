@@ -1,8 +1,380 @@
 from typing import Optional, List, Dict, Union, Any, Callable
+import atexit
 import functools
+import inspect
 import json
+import os
+import queue
+import threading
+import time
+import traceback
+import weakref
+import logging
 from logging import getLogger
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _dumps(obj) -> str:
+    """Serialize details compactly, with the same output whether or not orjson is installed."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj).decode('utf-8')
+        except TypeError:
+            # orjson rejects float subclasses (numpy.float64), non-str keys and ints over 64 bits
+            pass
+    return json.dumps(obj, ensure_ascii=False, separators=(',', ':'))
+
+from ..tgbot import TelegramBot
+
+_STATUS_OK = "✅ SUCCESS"
+_STATUS_ERR = "❌ ERROR"
+
+# -------------------- specialized trading wrappers --------------------
+# Each trading wrapper is generated from the API method's own signature, so it
+# binds arguments exactly like the method and reads the values it reports on as
+# plain locals, with no *args/**kwargs probing per call. The generated factory is
+# cached per underlying function; building a wrapper only calls the factory.
+
+_MISSING = object()
+
+
+def _label(value):
+    return "unknown" if value is _MISSING or value is None else value
+
+
+# method -> (documented parameter order, (details key, expression) pairs,
+#            success action, failure action, optional prelude)
+# Actions are f-string bodies and may use the parameter names and prelude locals.
+_WRAPPER_SPECS = {
+    "set_stop_loss_take_profit": (
+        ("symbol", "side", "quantity", "stop_loss_price", "take_profit_price"),
+        (
+            ("symbol", "symbol"),
+            ("side", "side"),
+            ("quantity", "quantity"),
+            ("stop loss", "stop_loss_price"),
+            ("take profit", "take_profit_price"),
+        ),
+        "Set SL/TP for {_label(symbol)} ({_label(side)})",
+        "Failed to set SL/TP for {_label(symbol)} ({_label(side)})",
+        None,
+    ),
+    "place_market_order": (
+        ("symbol", "position_type", "leverage", "amount", "stop_loss_price", "take_profit_price"),
+        (
+            ("symbol", "symbol"),
+            ("position", "position_type"),
+            ("leverage", "leverage"),
+            ("amount", "amount"),
+            ("stop loss", "stop_loss_price"),
+            ("take profit", "take_profit_price"),
+        ),
+        "Placed market {_label(position_type)} order for {_label(symbol)}",
+        "Failed to place market {_label(position_type)} order for {_label(symbol)}",
+        None,
+    ),
+    "place_limit_order": (
+        ("symbol", "position_type", "price", "leverage", "amount"),
+        (
+            ("symbol", "symbol"),
+            ("position", "position_type"),
+            ("price", "price"),
+            ("leverage", "leverage"),
+            ("amount", "amount"),
+        ),
+        "Placed limit {_label(position_type)} order for {_label(symbol)} at {_label(price)}",
+        "Failed to place limit {_label(position_type)} order for {_label(symbol)}",
+        None,
+    ),
+    "close_position": (
+        ("symbol", "position_type"),
+        (("symbol", "symbol"), ("position", "position_type")),
+        "Closed {_label(position_type)} position for {_label(symbol)}",
+        "Failed to close {_label(position_type)} position for {_label(symbol)}",
+        None,
+    ),
+    "cancel_order": (
+        ("symbol", "type"),
+        (("symbol", "symbol"), ("type", "type or None")),
+        "Cancelled{_w_type} orders for {_label(symbol)}",
+        "Failed to cancel{_w_type} orders for {_label(symbol)}",
+        '_w_type = f" {type}" if type and type is not _MISSING else ""',
+    ),
+}
+
+# Fallback signature for methods that cannot be inspected or whose parameter
+# names would clash with the generated code
+_GENERIC_PARAMS = (
+    inspect.Parameter("_w_args", inspect.Parameter.VAR_POSITIONAL),
+    inspect.Parameter("_w_kwargs", inspect.Parameter.VAR_KEYWORD),
+)
+
+# function -> {method name: factory}
+_FACTORY_CACHE = weakref.WeakKeyDictionary()
+
+
+def _trading_wrapper_factory(method_name: str, method: Callable) -> Callable:
+    """Return make(method, log_and_notify) -> wrapper, generated once per function."""
+    func = getattr(method, "__func__", None)
+    try:
+        factories = _FACTORY_CACHE.setdefault(func, {}) if func is not None else None
+    except TypeError:
+        factories = None
+    if factories is not None and method_name in factories:
+        return factories[method_name]
+    
+    try:
+        params = tuple(inspect.signature(method).parameters.values())
+    except (TypeError, ValueError):
+        params = _GENERIC_PARAMS
+    factory = _generate_wrapper_factory(method_name, params)
+    if factories is not None:
+        factories[method_name] = factory
+    return factory
+
+
+def _generate_wrapper_factory(method_name: str, params) -> Callable:
+    """Compile a wrapper factory whose wrapper has exactly the given parameters."""
+    fields, details, success, failure, prelude = _WRAPPER_SPECS[method_name]
+    reserved = {method_name, "_MISSING", "_label", "Exception"}
+    if any(p.name.startswith("_w_") or p.name in reserved for p in params):
+        params = _GENERIC_PARAMS
+    
+    namespace = {"_MISSING": _MISSING, "_label": _label}
+    signature, call = [], []
+    positional = []
+    var_args = var_kwargs = None
+    for p in params:
+        text = p.name
+        if p.default is not p.empty:
+            namespace[f"_w_default_{p.name}"] = p.default
+            text = f"{p.name}=_w_default_{p.name}"
+        
+        if p.kind is p.VAR_POSITIONAL:
+            var_args = p.name
+            signature.append(f"*{p.name}")
+            call.append(f"*{p.name}")
+        elif p.kind is p.VAR_KEYWORD:
+            var_kwargs = p.name
+            signature.append(f"**{p.name}")
+            call.append(f"**{p.name}")
+        elif p.kind is p.KEYWORD_ONLY:
+            if var_args is None and "*" not in signature:
+                signature.append("*")
+            signature.append(text)
+            call.append(f"{p.name}={p.name}")
+        else:
+            positional.append(p.name)
+            signature.append(text)
+            call.append(p.name)
+    # Positional-only parameters always come first
+    positional_only = sum(p.kind is p.POSITIONAL_ONLY for p in params)
+    if positional_only:
+        signature.insert(positional_only, "/")
+    
+    names = {p.name for p in params}
+    # Locals that always hold a passed or default value, never _MISSING
+    bound = {p.name for p in params if p.kind not in (p.VAR_POSITIONAL, p.VAR_KEYWORD)}
+    body = []
+    # Reported values the signature does not name: documented position, then *args / **kwargs
+    for i, field in enumerate(fields):
+        if field in names:
+            continue
+        if i < len(positional) and positional[i] not in fields:
+            body.append(f"{field} = {positional[i]}")
+            bound.add(field)
+            continue
+        lookup = f"{var_kwargs}.get({field!r}, _MISSING)" if var_kwargs else "_MISSING"
+        if var_args and i >= len(positional):
+            j = i - len(positional)
+            lookup = f"{var_args}[{j}] if len({var_args}) > {j} else {lookup}"
+        body.append(f"{field} = {lookup}")
+    if prelude:
+        body.append(prelude)
+    
+    body.append("_w_details = {}")
+    for key, expr in details:
+        value = expr
+        if not expr.isidentifier():
+            body.append(f"_w_value = {expr}")
+            value = "_w_value"
+        if value in bound:
+            body.append(f"if {value} is not None:")
+        else:
+            body.append(f"if {value} is not None and {value} is not _MISSING:")
+        body.append(f"    _w_details[{key!r}] = {value}")
+    
+    body += [
+        "try:",
+        f"    _w_result = _w_method({', '.join(call)})",
+        "except Exception as _w_error:",
+        f"    _w_log(f{failure!r}, False, _w_details, _w_error)",
+        "    raise",
+        f"_w_log(f{success!r}, True, _w_details)",
+        "return _w_result",
+    ]
+    source = "\n".join(
+        ["def _w_make(_w_method, _w_log):", f"    def {method_name}({', '.join(signature)}):"]
+        + [f"        {line}" for line in body]
+        + [f"    return {method_name}"]
+    )
+    exec(compile(source, f"<{method_name} wrapper>", "exec"), namespace)
+    return namespace["_w_make"]
+
+
+class _Notifier:
+    """
+    Background worker sending the Telegram notifications of every FuturesAPIDecorator.
+    
+    One thread and one bounded queue are shared by all decorators, so messages for
+    the same bot are batched together whichever decorator queued them. The thread
+    and queue are created on first use, and again in a forked child.
+    """
+    
+    def __init__(self, settings):
+        """
+        Args:
+            settings: The decorator class, providing the NOTIFY_* limits
+        """
+        self._settings = settings
+        self._lock = threading.Lock()
+        self._queue = None
+        self._worker = None
+    
+    def put(self, tgbot, logger, message: str) -> bool:
+        """Queue a message without blocking; return False if the queue is full."""
+        notify_queue = self._queue
+        if notify_queue is None:
+            notify_queue = self._start()
+        try:
+            notify_queue.put_nowait((tgbot, logger, message))
+        except queue.Full:
+            return False
+        return True
+    
+    def flush(self, timeout: float = 5.0) -> bool:
+        """Block until the messages queued so far have been sent; return False on timeout."""
+        notify_queue = self._queue
+        if notify_queue is None:
+            return True
+        deadline = time.monotonic() + timeout
+        done = threading.Event()
+        try:
+            notify_queue.put(done, timeout=timeout)
+        except queue.Full:
+            return False
+        return done.wait(max(deadline - time.monotonic(), 0))
+    
+    def stop(self, timeout: float = 5.0) -> None:
+        """Send pending messages, then stop the worker thread. Runs at interpreter exit."""
+        with self._lock:
+            notify_queue, worker = self._queue, self._worker
+            self._queue = self._worker = None
+        if worker is None or not worker.is_alive():
+            return
+        try:
+            notify_queue.put(None, timeout=timeout)
+        except queue.Full:
+            return
+        worker.join(timeout)
+    
+    def _start(self) -> queue.Queue:
+        """Create the queue and start the worker thread if not running yet."""
+        with self._lock:
+            if self._queue is None:
+                self._queue = queue.Queue(maxsize=self._settings.NOTIFY_QUEUE_SIZE)
+                self._worker = threading.Thread(
+                    target=self._run, args=(self._queue,), name="FuturesAPIDecorator-notify", daemon=True
+                )
+                self._worker.start()
+            return self._queue
+    
+    def _after_fork_in_child(self) -> None:
+        # The worker thread does not survive fork, and its queue may hold a locked mutex
+        self._lock = threading.Lock()
+        self._queue = None
+        self._worker = None
+    
+    def _run(self, notify_queue: queue.Queue) -> None:
+        """
+        Background worker: batch queued Telegram messages per bot.
+        
+        After the first message of a batch arrives, further messages are collected
+        for up to the current batch window and sent together. The window doubles
+        while the queue stays backlogged and halves when it runs dry; a message that
+        arrives to an empty queue always waits only the shortest window.
+        """
+        settings = self._settings
+        window = settings.NOTIFY_BATCH_WINDOW_MIN
+        while True:
+            item = notify_queue.get()
+            if item is None:
+                return
+            # Nothing else waiting: don't hold a lone order behind a window grown by an earlier burst
+            if notify_queue.empty():
+                window = settings.NOTIFY_BATCH_WINDOW_MIN
+            
+            pending = {}
+            flushed = []
+            stop = False
+            count = self._add(item, pending, flushed)
+            deadline = time.monotonic() + window
+            # A flush request sends what has been collected right away
+            while count < settings.NOTIFY_BATCH_MAX and not flushed:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    item = notify_queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if item is None:
+                    stop = True
+                    break
+                count += self._add(item, pending, flushed)
+            
+            self._send(pending)
+            for done in flushed:
+                done.set()
+            
+            # Adapt the batch window to the backlog
+            backlog = notify_queue.qsize()
+            if backlog > settings.NOTIFY_BATCH_MAX:
+                window = min(window * 2, settings.NOTIFY_BATCH_WINDOW_MAX)
+            elif backlog == 0:
+                window = max(window / 2, settings.NOTIFY_BATCH_WINDOW_MIN)
+            
+            if stop:
+                return
+    
+    @staticmethod
+    def _add(item, pending: Dict, flushed: List[threading.Event]) -> int:
+        """Add one queued item to the batch; return the number of messages it adds."""
+        if isinstance(item, threading.Event):
+            flushed.append(item)
+            return 0
+        tgbot, logger, message = item
+        entry = pending.get(id(tgbot))
+        if entry is None:
+            pending[id(tgbot)] = (tgbot, logger, [message])
+        else:
+            entry[2].append(message)
+        return 1
+    
+    def _send(self, pending: Dict) -> None:
+        """Send each bot's messages, joined into as few sends as the length limit allows."""
+        for tgbot, logger, messages in pending.values():
+            for batch in TelegramBot.batch_messages(messages):
+                try:
+                    tgbot.send_message("\n".join(batch))
+                except Exception as e:
+                    logger.error(f"Failed to send Telegram notification: {str(e)}")
+
+
 class FuturesAPIDecorator:
     """
     A decorator class for FuturesAPI implementations. 
@@ -10,22 +382,39 @@ class FuturesAPIDecorator:
     """
     
     # Methods requiring logging and notifications
-    TRADING_METHODS = [
+    TRADING_METHODS = frozenset([
         'set_stop_loss_take_profit',
         'place_market_order',
         'place_limit_order',
         'close_position',
         'cancel_order'
-    ]
+    ])
     
     # Methods that just need to pass through without decoration
-    INFO_METHODS = [
+    INFO_METHODS = frozenset([
         'get_positions',
         'get_open_orders',
         'fetch_usdt_balance',
         'get_price',
         'get_historical_data'
-    ]
+    ])
+    
+    # Fixed instance attributes; decorated trading methods are set per instance
+    __slots__ = (
+        'api',
+        'logger',
+        'tgbot',
+        '_dropped_notifications',
+        '__weakref__',
+    ) + tuple(sorted(TRADING_METHODS))
+    
+    # Pending Telegram notifications (shared by all decorators) kept before new ones are dropped
+    NOTIFY_QUEUE_SIZE = 1024
+    
+    # Telegram batching: max events per message and adaptive wait window (seconds)
+    NOTIFY_BATCH_MAX = 20
+    NOTIFY_BATCH_WINDOW_MIN = 0.05
+    NOTIFY_BATCH_WINDOW_MAX = 1.0
     
     def __init__(self, api, tgbot=None, logger=None, token=None, chat_id=None):
         """
@@ -40,273 +429,142 @@ class FuturesAPIDecorator:
         """
         self.api = api
         
-        # Initialize logger
-        if logger is None:
-            self.logger = getLogger(__name__)
-        else:
-            self.logger = logger
+        self.logger = getLogger(__name__) if logger is None else logger
         
         # Initialize Telegram bot
         if tgbot is None and token and chat_id:
-            from .tgbot import TelegramBot
             self.tgbot = TelegramBot(token=token, chat_id=chat_id)
         else:
             self.tgbot = tgbot
+        
+        self._dropped_notifications = 0
             
         # Dynamically decorate methods
         self._decorate_methods()
     
-    def _log_and_notify(self, action: str, success: bool, details: Dict = None, error: Exception = None) -> None:
+    @property
+    def dropped_notification_count(self) -> int:
+        """Number of this decorator's Telegram notifications dropped because the queue was full."""
+        return self._dropped_notifications
+    
+    def flush_notifications(self, timeout: float = 5.0) -> bool:
         """
-        Log action and send notification via telegram.
+        Block until the Telegram notifications queued so far have been sent.
+        Pending notifications are also sent automatically at interpreter exit.
         
         Args:
-            action: Description of the action
-            success: Whether the action was successful
-            details: Additional details about the action
-            error: Exception if an error occurred
-        """
-        status = "✅ SUCCESS" if success else "❌ ERROR"
-        message = f"{status}: {action}"
-        
-        if details:
-            detail_str = json.dumps(details, ensure_ascii=False)
-            message += f", Details: {detail_str}"
+            timeout: Maximum seconds to wait for pending notifications to be sent
             
-        if error:
-            message += f", Error: {str(error)}"
-            self.logger.error(message)
-        else:
-            self.logger.info(message)
-            
-        # Send notification via telegram if available
-        if self.tgbot:
-            try:
-                message = f"{status}: {action}\n"
-                
-                if details:
-                    message += f"🧾 Details:\n"
-                    for key, value in details.items():
-                        message += f"{key}: {value}\n"
-                
-                if error:
-                    message += f"⚠️ Error: {str(object=error)}\n"
-                
-                self.tgbot.send_message(message)
-            except Exception as e:
-                self.logger.error(f"Failed to send Telegram notification: {str(e)}")
-    
-    def _decorate_methods(self):
-        """
-        Dynamically decorate API methods based on their type.
-        Trading methods get logging and notifications,
-        Info methods are passed through directly.
+        Returns:
+            bool: False if the timeout expired first
         """
-        for method_name in dir(self.api):
-            # Skip private/special methods
-            if method_name.startswith('_'):
-                continue
-                
-            # Get the method
-            method = getattr(self.api, method_name)
-            if not callable(method):
-                continue
-                
-            if method_name in self.TRADING_METHODS:
-                # Decorate trading methods
-                setattr(self, method_name, self._create_trading_decorator(method_name, method))
-            elif method_name in self.INFO_METHODS:
-                # Pass through info methods
-                setattr(self, method_name, method)
-            else:
-                # For any other methods, just pass them through
-                setattr(self, method_name, method)
+        return _NOTIFIER.flush(timeout)
     
-    def _create_trading_decorator(self, method_name, method):
+    def _log_and_notify(self, action: str, success: bool, details: Dict = None, error: Exception = None) -> None:
         """
-        Create a decorator for trading methods that adds logging and notifications.
+        Log action on the calling thread and queue its telegram notification.
+        
+        The log line is always written; the logger's own handlers (e.g. set_logger's
+        background file writer) keep file I/O off the trading path. Only the telegram
+        message goes through the shared background worker, and it is dropped (and
+        counted in dropped_notification_count) if that queue is full.
         
         Args:
-            method_name: Name of the method being decorated
-            method: The method function to decorate
-            
-        Returns:
-            function: Decorated method
+            action: Description of the action
+            success: Whether the action was successful
+            details: Additional details about the action
+            error: Exception if an error occurred
         """
-        @functools.wraps(method)
-        def wrapper(*args, **kwargs):
-            # Extract relevant information for logging
-            details = self._extract_details(method_name, args, kwargs)
-            
+        try:
+            message = self._emit(action, success, details, error)
+        except Exception:
+            # A broken logger must not turn a completed trade into an error, but don't hide it
             try:
-                result = method(*args, **kwargs)
-                action = self._get_success_message(method_name, args, kwargs)
-                self._log_and_notify(action, True, details)
-                return result
-            except Exception as e:
-                action = self._get_error_message(method_name, args, kwargs)
-                self._log_and_notify(action, False, details, e)
-                raise
-        
-        return wrapper
+                self.logger.exception("Failed to log trading event")
+            except Exception:
+                traceback.print_exc()
+            return
+        if message and not _NOTIFIER.put(self.tgbot, self.logger, message):
+            self._dropped_notifications += 1
     
-    def _extract_details(self, method_name, args, kwargs):
+    def _emit(self, action: str, success: bool, details: Dict = None, error: Exception = None) -> Optional[str]:
         """
-        Extract relevant details for logging based on method name and arguments.
+        Log action and build its telegram notification.
         
         Args:
-            method_name: Name of the method
-            args: Positional arguments
-            kwargs: Keyword arguments
+            action: Description of the action
+            success: Whether the action was successful
+            details: Additional details about the action
+            error: Exception if an error occurred
             
         Returns:
-            dict: Details for logging
+            str: Telegram message, or None if no TelegramBot is configured
         """
-        details = {}
+        status = _STATUS_OK if success else _STATUS_ERR
+        level = logging.ERROR if error else logging.INFO
         
-        # First argument after self is usually symbol
-        if len(args) > 1:
-            details["symbol"] = args[1]
-        elif "symbol" in kwargs:
-            details["symbol"] = kwargs["symbol"]
-            
-        # Extract other common parameters based on method name
-        if method_name == "set_stop_loss_take_profit":
-            if len(args) > 2:
-                details["side"] = args[2]
-            if len(args) > 3:
-                details["quantity"] = args[3]
-            if len(args) > 4:
-                details["stop_loss"] = args[4]
-            if len(args) > 5:
-                details["take_profit"] = args[5]
-                
-            # Override with kwargs if present
-            details.update({k: v for k, v in kwargs.items() if k in ["side", "quantity", "stop_loss_price", "take_profit_price"]})
-            
-        elif method_name in ["place_market_order", "place_limit_order"]:
-            if len(args) > 2:
-                details["position"] = args[2]
-            if method_name == "place_limit_order" and len(args) > 3:
-                details["price"] = args[3]
-            if len(args) > (4 if method_name == "place_limit_order" else 3):
-                details["leverage"] = args[4 if method_name == "place_limit_order" else 3]
-            if len(args) > (5 if method_name == "place_limit_order" else 4):
-                details["amount"] = args[5 if method_name == "place_limit_order" else 4]
-                
-            # Add stop loss and take profit for market orders
-            if method_name == "place_market_order":
-                if len(args) > 5:
-                    details["stop_loss"] = args[5]
-                if len(args) > 6:
-                    details["take_profit"] = args[6]
-                    
-            # # Override with kwargs if present
-            # details.update({k: v for k, v in kwargs.items() 
-            #               if k in ["position_type", "price", "leverage", "amount", "stop_loss_price", "take_profit_price"]})
-            
-            # 對應 key 轉換表
-            key_mapping = {
-                "position_type": "position",
-                "price": "price",
-                "leverage": "leverage",
-                "amount": "amount",
-                "stop_loss_price": "stop loss",
-                "take_profit_price": "take profit"
-            }
-
-            # 轉換後更新 details
-            details.update({
-                key_mapping[k]: v for k, v in kwargs.items() if k in key_mapping
-            })
+        # Only build the log line when the logger will actually emit it
+        is_enabled = getattr(self.logger, "isEnabledFor", None)
+        if is_enabled is None or is_enabled(level):
+            parts = [f"{status}: {action}"]
+            if details:
+                parts.append(f"Details: {_dumps(details)}")
+            if error:
+                parts.append(f"Error: {str(error)}")
+                self.logger.error(", ".join(parts))
+            else:
+                self.logger.info(", ".join(parts))
             
-                
-                
-        elif method_name == "close_position":
-            if len(args) > 2:
-                details["position"] = args[2]
-            if "position_type" in kwargs:
-                details["position"] = kwargs["position_type"]
-                
-        elif method_name == "cancel_order":
-            if len(args) > 2:
-                details["type"] = args[2]
-            if "type" in kwargs:
-                details["type"] = kwargs["type"]
-                
-        return details
+        # Build notification for telegram if available
+        if not self.tgbot:
+            return None
+        
+        lines = [f"{status}: {action}"]
+        if details:
+            lines.append("🧾 Details:")
+            lines.extend(f"{key}: {value}" for key, value in details.items())
+        if error:
+            lines.append(f"⚠️ Error: {str(error)}")
+        lines.append("")
+        
+        return "\n".join(lines)
     
-    def _get_success_message(self, method_name, args, kwargs):
+    def _decorate_methods(self):
         """
-        Generate a success message based on the method and arguments.
-        
-        Args:
-            method_name: Name of the method
-            args: Positional arguments
-            kwargs: Keyword arguments
-            
-        Returns:
-            str: Success message
+        Decorate the trading methods the API provides with logging and notifications.
+        Info methods and any other public attributes are resolved lazily
+        through __getattr__, so they are not bound at construction time.
         """
-        symbol = args[1] if len(args) > 1 else kwargs.get("symbol", "unknown")
-        
-        if method_name == "set_stop_loss_take_profit":
-            side = args[2] if len(args) > 2 else kwargs.get("side", "unknown")
-            return f"Set SL/TP for {symbol} ({side})"
-            
-        elif method_name == "place_market_order":
-            position_type = args[2] if len(args) > 2 else kwargs.get("position_type", "unknown")
-            return f"Placed market {position_type} order for {symbol}"
-            
-        elif method_name == "place_limit_order":
-            position_type = args[2] if len(args) > 2 else kwargs.get("position_type", "unknown")
-            price = args[3] if len(args) > 3 else kwargs.get("price", "unknown")
-            return f"Placed limit {position_type} order for {symbol} at {price}"
-            
-        elif method_name == "close_position":
-            position_type = args[2] if len(args) > 2 else kwargs.get("position_type", "unknown")
-            return f"Closed {position_type} position for {symbol}"
-            
-        elif method_name == "cancel_order":
-            order_type = args[2] if len(args) > 2 else kwargs.get("type", "")
-            type_str = f" {order_type}" if order_type else ""
-            return f"Cancelled{type_str} orders for {symbol}"
-            
-        return f"Executed {method_name} for {symbol}"
+        for method_name in self.TRADING_METHODS:
+            method = getattr(self.api, method_name, None)
+            if method is None or not callable(method):
+                continue
+            setattr(self, method_name, self._create_trading_decorator(method_name, method))
     
-    def _get_error_message(self, method_name, args, kwargs):
+    def __getattr__(self, name):
+        """Pass through non-trading public attributes to the wrapped API."""
+        # Guard against recursion before self.api is set and hide private names
+        if name.startswith('_') or name == 'api':
+            raise AttributeError(name)
+        return getattr(self.api, name)
+    
+    def _create_trading_decorator(self, method_name, method):
         """
-        Generate an error message based on the method and arguments.
+        Create a decorator for trading methods that adds logging and notifications.
         
         Args:
-            method_name: Name of the method
-            args: Positional arguments
-            kwargs: Keyword arguments
+            method_name: Name of the method being decorated
+            method: The method function to decorate
             
         Returns:
-            str: Error message
+            function: Decorated method
         """
-        symbol = args[1] if len(args) > 1 else kwargs.get("symbol", "unknown")
-        
-        if method_name == "set_stop_loss_take_profit":
-            side = args[2] if len(args) > 2 else kwargs.get("side", "unknown")
-            return f"Failed to set SL/TP for {symbol} ({side})"
-            
-        elif method_name == "place_market_order":
-            position_type = args[2] if len(args) > 2 else kwargs.get("position_type", "unknown")
-            return f"Failed to place market {position_type} order for {symbol}"
-            
-        elif method_name == "place_limit_order":
-            position_type = args[2] if len(args) > 2 else kwargs.get("position_type", "unknown")
-            return f"Failed to place limit {position_type} order for {symbol}"
-            
-        elif method_name == "close_position":
-            position_type = args[2] if len(args) > 2 else kwargs.get("position_type", "unknown")
-            return f"Failed to close {position_type} position for {symbol}"
-            
-        elif method_name == "cancel_order":
-            order_type = args[2] if len(args) > 2 else kwargs.get("type", "")
-            type_str = f" {order_type}" if order_type else ""
-            return f"Failed to cancel{type_str} orders for {symbol}"
-            
-        return f"Failed to execute {method_name} for {symbol}"
+        wrapper = _trading_wrapper_factory(method_name, method)(method, self._log_and_notify)
+        return functools.update_wrapper(wrapper, method)
+
+
+# One worker for all decorators; sends whatever is still queued at interpreter exit
+_NOTIFIER = _Notifier(FuturesAPIDecorator)
+atexit.register(_NOTIFIER.stop)
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_NOTIFIER._after_fork_in_child)
@@ -1,69 +1,159 @@
 import os
-import json
+from contextlib import contextmanager
+
+try:
+    import orjson
+
+    def _dump_json(data) -> bytes:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+
+    _load_json = orjson.loads
+except ImportError:
+    import json
+
+    def _dump_json(data) -> bytes:
+        return json.dumps(data, indent=4).encode('utf-8')
+
+    _load_json = json.loads
+
+# Parsed exclusion files keyed by absolute path: ((mtime_ns, size), stable_coins, problematic_coins)
+_LOAD_CACHE: dict = {}
+
+
+def _file_version(file_stat: os.stat_result) -> tuple:
+    """Cache key for a file's contents; size catches edits within the mtime granularity."""
+    return (file_stat.st_mtime_ns, file_stat.st_size)
 
 
 class ExclusionCoinsRecord:
+    __slots__ = (
+        'exclusion_coins_path',
+        'stable_coins',
+        'problematic_coins',
+        '_excluded',
+        '_dirty',
+        '_batching',
+    )
+    
     def __init__(self, exclusion_coins_path: str = "data/exclusion_coins.json"):
         self.exclusion_coins_path = exclusion_coins_path
-        if not os.path.exists(self.exclusion_coins_path):
-            self.stable_coins = []
-            self.problematic_coins = []
+        self._dirty = False
+        self._batching = 0
+        try:
+            file_stat = os.stat(self.exclusion_coins_path)
+        except FileNotFoundError:
+            self.stable_coins = set()
+            self.problematic_coins = set()
         else:
-            with open(self.exclusion_coins_path, 'r') as file:
-                exclusion_data = json.load(file)
-            self.stable_coins = exclusion_data.get("stable_coins", [])
-            self.problematic_coins = exclusion_data.get("problematic_coins", [])
+            stable_coins, problematic_coins = self._load_exclusion_coins(_file_version(file_stat))
+            self.stable_coins = set(stable_coins)
+            self.problematic_coins = set(problematic_coins)
+        self._refresh_excluded()
             
     def add_stable_coin(self, coin_symbol: str):
         """Add a stable coin to the exclusion list."""
-        
-        if coin_symbol != "USDT" and coin_symbol.endswith("USDT"):
-            coin_symbol = coin_symbol[:-4]
-        
-        if coin_symbol and coin_symbol not in self.stable_coins:
-            self.stable_coins.append(coin_symbol)
-            self._save_exclusion_coins()
+        self._add_coin(self.stable_coins, coin_symbol)
     
     def add_problematic_coin(self, coin_symbol: str):
         """Add a problematic coin to the exclusion list."""
-        
-        if coin_symbol != "USDT" and coin_symbol.endswith("USDT"):
-            coin_symbol = coin_symbol[:-4]
-        
-        if coin_symbol and coin_symbol not in self.problematic_coins:
-            self.problematic_coins.append(coin_symbol)
-            self._save_exclusion_coins()
+        self._add_coin(self.problematic_coins, coin_symbol)
     
     def get_stable_coins(self) -> list:
-        """Return the list of stable coins."""
-        return self.stable_coins
+        """Return the sorted list of stable coins."""
+        return sorted(self.stable_coins)
     
     def get_problematic_coins(self) -> list:
-        """Return the list of problematic coins."""
-        return self.problematic_coins
+        """Return the sorted list of problematic coins."""
+        return sorted(self.problematic_coins)
     
     def get_exclusion_coins(self) -> list:
         """Return a combined list of stable and problematic coins."""
-        return self.stable_coins + self.problematic_coins        
+        return self.get_stable_coins() + self.get_problematic_coins()
+    
+    @contextmanager
+    def batch(self):
+        """
+        Group several add_* calls into a single file write.
+        
+        Example:
+            with record.batch():
+                for coin in coins:
+                    record.add_problematic_coin(coin)
+        """
+        self._batching += 1
+        try:
+            yield self
+        finally:
+            self._batching -= 1
+            self._maybe_save()
     
     def filter_symbols(self, symbols: list) -> list:
         """Filter out stable and problematic symbols from the provided list."""
         
-        exclusion_symbols = [i+"USDT" for i in self.get_exclusion_coins()]
+        excluded = self._excluded
         return [
             symbol for symbol in symbols 
-            if symbol not in exclusion_symbols
+            if symbol not in excluded
         ]
     
     # -------------------- assisted functions --------------------
+    @staticmethod
+    def _normalize(coin_symbol: str) -> str:
+        """Strip the USDT quote suffix, keeping USDT itself intact."""
+        if coin_symbol != "USDT":
+            coin_symbol = coin_symbol.removesuffix("USDT")
+        return coin_symbol
+    
+    def _add_coin(self, coins: set, coin_symbol: str):
+        """Add a normalized coin to the given exclusion set and persist it."""
+        coin_symbol = self._normalize(coin_symbol)
+        if coin_symbol and coin_symbol not in coins:
+            coins.add(coin_symbol)
+            self._excluded.add(coin_symbol + "USDT")
+            self._dirty = True
+            self._maybe_save()
+    
+    def _refresh_excluded(self):
+        """Rebuild the set of excluded USDT trading symbols."""
+        self._excluded = {i+"USDT" for i in self.stable_coins | self.problematic_coins}
+    
+    def _maybe_save(self):
+        """Save pending changes unless a batch() block is still open."""
+        if self._dirty and not self._batching:
+            self._save_exclusion_coins()
+    
+    def _load_exclusion_coins(self, version: tuple) -> tuple:
+        """Return (stable, problematic) frozensets, re-reading the file only if it changed."""
+        key = os.path.abspath(self.exclusion_coins_path)
+        cached = _LOAD_CACHE.get(key)
+        if cached is not None and cached[0] == version:
+            return cached[1], cached[2]
+        
+        with open(self.exclusion_coins_path, 'rb') as file:
+            exclusion_data = _load_json(file.read())
+        stable_coins = frozenset(exclusion_data.get("stable_coins", []))
+        problematic_coins = frozenset(exclusion_data.get("problematic_coins", []))
+        _LOAD_CACHE[key] = (version, stable_coins, problematic_coins)
+        return stable_coins, problematic_coins
+    
     def _save_exclusion_coins(self):
-        """Save the updated exclusion coins to the JSON file."""
+        """Atomically save the updated exclusion coins to the JSON file."""
         exclusion_data = {
-            "stable_coins": self.stable_coins,
-            "problematic_coins": self.problematic_coins
+            "stable_coins": sorted(self.stable_coins),
+            "problematic_coins": sorted(self.problematic_coins)
         }
-        with open(self.exclusion_coins_path, 'w') as file:
-            json.dump(exclusion_data, file, indent=4)
+        tmp_path = self.exclusion_coins_path + ".tmp"
+        with open(tmp_path, 'wb') as file:
+            file.write(_dump_json(exclusion_data))
+        os.replace(tmp_path, self.exclusion_coins_path)
+        self._dirty = False
+        
+        # Keep the load cache in step with what was just written
+        _LOAD_CACHE[os.path.abspath(self.exclusion_coins_path)] = (
+            _file_version(os.stat(self.exclusion_coins_path)),
+            frozenset(self.stable_coins),
+            frozenset(self.problematic_coins),
+        )
     
     
 # Example usage:
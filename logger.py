@@ -1,9 +1,13 @@
+import atexit
+import functools
 import logging
 import os
-from logging.handlers import RotatingFileHandler
+import queue
+import stat
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from typing import Optional, Union
-import pytz
-from datetime import datetime
+from datetime import datetime, tzinfo
+from zoneinfo import ZoneInfo
 
 # 彩色輸出輔助
 LEVEL_COLORS = {
@@ -15,29 +19,115 @@ LEVEL_COLORS = {
 }
 RESET_COLOR = "\033[0m"
 
+# 預先組好彩色 [LEVEL] 字串，避免每筆紀錄重新格式化
+COLORED_LEVELNAMES = {
+    level: f"{color}[{level}]{RESET_COLOR}" for level, color in LEVEL_COLORS.items()
+}
+
+DEFAULT_DATEFMT = '%Y-%m-%d %H:%M:%S'
+
+# 各 logger 的背景寫檔 listener（以 logger 名稱為 key）
+_QUEUE_LISTENERS = {}
+
+def _stop_queue_listener(name: str) -> None:
+    """停止並移除指定 logger 的背景寫檔 listener，寫完佇列中剩餘的紀錄後關閉檔案"""
+    listener = _QUEUE_LISTENERS.pop(name, None)
+    if listener is not None:
+        listener.stop()
+        for handler in listener.handlers:
+            handler.close()
+
+@atexit.register
+def _stop_all_queue_listeners() -> None:
+    for name in list(_QUEUE_LISTENERS):
+        _stop_queue_listener(name)
+
+def _write_inline_in_child() -> None:
+    """
+    fork 出的子行程沒有 listener 執行緒，且常以 os._exit 結束而不會執行 atexit，
+    因此改回由呼叫端直接寫檔。fork 當下佇列中的紀錄由父行程寫入。
+    """
+    for name, listener in list(_QUEUE_LISTENERS.items()):
+        logger = logging.getLogger(name)
+        logger.handlers = [
+            handler for handler in logger.handlers
+            if not (isinstance(handler, QueueHandler) and handler.queue is listener.queue)
+        ] + list(listener.handlers)
+    _QUEUE_LISTENERS.clear()
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_write_inline_in_child)
+
+@functools.lru_cache(maxsize=32)
+def _get_timezone(name: str) -> ZoneInfo:
+    """快取時區物件，避免重複解析 TZif 檔"""
+    return ZoneInfo(name)
+
 class TimezoneFormatter(logging.Formatter):
     """支援時區的 Formatter"""
     def __init__(self, fmt=None, datefmt=None, timezone=None):
         super().__init__(fmt, datefmt)
         self.timezone = timezone
+        # 同一秒內的紀錄共用格式化結果: (秒, datefmt, 字串)
+        self._time_cache = (None, None, '')
     
     def formatTime(self, record, datefmt=None):
-        if self.timezone:
-            dt = datetime.fromtimestamp(record.created, tz=self.timezone)
-        else:
-            dt = datetime.fromtimestamp(record.created)
+        datefmt = datefmt or DEFAULT_DATEFMT
+        sec = int(record.created)
+        cached_sec, cached_fmt, cached_str = self._time_cache
+        if sec == cached_sec and datefmt == cached_fmt:
+            return cached_str
         
-        if datefmt:
-            return dt.strftime(datefmt)
-        else:
-            return dt.strftime('%Y-%m-%d %H:%M:%S')
+        # 含 %f 的格式無法以秒為單位快取
+        timestamp = record.created if '%f' in datefmt else sec
+        dt = datetime.fromtimestamp(timestamp, tz=self.timezone)
+        formatted = dt.strftime(datefmt)
+        if timestamp == sec:
+            self._time_cache = (sec, datefmt, formatted)
+        return formatted
 
 class ColoredFormatter(TimezoneFormatter):
     def format(self, record):
         levelname = record.levelname
-        color = LEVEL_COLORS.get(levelname, "")
-        record.levelname = f"{color}[{levelname}]{RESET_COLOR}"
-        return super().format(record)
+        colored = COLORED_LEVELNAMES.get(levelname)
+        if colored is None:
+            colored = f"[{levelname}]{RESET_COLOR}"
+        record.levelname = colored
+        try:
+            return super().format(record)
+        finally:
+            # 還原，避免其他 handler 看到彩色 levelname
+            record.levelname = levelname
+
+class SizeTrackingRotatingFileHandler(RotatingFileHandler):
+    """
+    只格式化一次的 RotatingFileHandler。
+    標準版每筆紀錄都會先格式化一次判斷是否輪替、再 seek/tell 檔尾，寫入時又格式化一次；
+    這裡只格式化一次，並以 fstat 取得檔案實際大小，
+    多個 handler 或行程寫入同一個檔案時仍能正確輪替。
+    """
+    def emit(self, record):
+        try:
+            msg = self.format(record) + self.terminator
+            if self.stream is None:
+                self.stream = self._open()
+            if self.maxBytes > 0:
+                # 每筆寫入後都會 flush，fstat 的大小即包含所有已寫入的紀錄
+                st = os.fstat(self.stream.fileno())
+                # 非一般檔案（如 /dev/null）不輪替，與標準版行為一致
+                if stat.S_ISREG(st.st_mode):
+                    # 以寫入的位元組數計算大小（中文等多位元組字元不能用字元數）
+                    msg_size = len(msg.encode(self.encoding or 'utf-8'))
+                    if st.st_size + msg_size >= self.maxBytes:
+                        self.doRollover()
+                        if self.stream is None:
+                            self.stream = self._open()
+            self.stream.write(msg)
+            self.flush()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
 
 def set_logger(
     name: str,
@@ -47,30 +137,35 @@ def set_logger(
     log_level: int = logging.DEBUG,
     max_bytes: int = 5 * 1024 * 1024,  # 5MB
     backup_count: int = 3,
-    timezone: Optional[Union[str, pytz.BaseTzInfo]] = None
+    timezone: Optional[Union[str, tzinfo]] = None,
+    async_file: bool = True
 ) -> logging.Logger:
     
     # 步驟 1: 設定 logger
     logger = logging.getLogger(name)
     logger.setLevel(log_level)
-    logger.handlers.clear()  # 清除現有 handlers
+    _stop_queue_listener(name)
+    # 清除現有 handlers，並關閉以免重複呼叫時洩漏檔案描述符
+    for handler in logger.handlers:
+        handler.close()
+    logger.handlers.clear()
 
     # 處理時區參數
     tz = None
     if timezone:
         if isinstance(timezone, str):
-            # 如果是字符串，轉換為 pytz 時區對象
-            tz = pytz.timezone(timezone)
-        elif isinstance(timezone, pytz.BaseTzInfo):
-            # 如果已經是 pytz 時區對象，直接使用
+            # 如果是字符串，轉換為 ZoneInfo 時區對象
+            tz = _get_timezone(timezone)
+        elif isinstance(timezone, tzinfo):
+            # 如果已經是 tzinfo 物件（ZoneInfo、pytz 等），直接使用
             tz = timezone
         else:
-            raise ValueError(f"timezone 必須是字符串或 pytz.BaseTzInfo 物件，收到: {type(timezone)}")
+            raise ValueError(f"timezone 必須是字符串或 tzinfo 物件，收到: {type(timezone)}")
 
     # --- File 格式（詳細） ---
     file_formatter = TimezoneFormatter(
         '%(asctime)s | %(name)s | %(levelname)s | %(message)s',
-        datefmt='%Y-%m-%d %H:%M:%S',
+        datefmt=DEFAULT_DATEFMT,
         timezone=tz
     )
 
@@ -83,16 +178,29 @@ def set_logger(
     # 步驟 2: 檔案 handler
     if filepath is not None:
         dirpath = os.path.dirname(filepath)
-        os.makedirs(dirpath, exist_ok=True)
-        file_handler = RotatingFileHandler(
+        # dirpath 為空代表寫在目前目錄，不需建立
+        if dirpath:
+            os.makedirs(dirpath, exist_ok=True)
+        file_handler = SizeTrackingRotatingFileHandler(
             filepath,
             maxBytes=max_bytes,
             backupCount=backup_count,
-            encoding='utf-8'
+            encoding='utf-8',
+            delay=True  # 第一筆紀錄寫入時才開檔
         )
         file_handler.setLevel(file_log_level)
         file_handler.setFormatter(file_formatter)
-        logger.addHandler(file_handler)
+        if async_file:
+            # 寫檔與輪替交給背景執行緒，呼叫端只需把紀錄放進佇列
+            log_queue = queue.Queue(-1)
+            queue_handler = QueueHandler(log_queue)
+            queue_handler.setLevel(file_log_level)
+            logger.addHandler(queue_handler)
+            listener = QueueListener(log_queue, file_handler, respect_handler_level=True)
+            listener.start()
+            _QUEUE_LISTENERS[name] = listener
+        else:
+            logger.addHandler(file_handler)
 
     # 步驟 3: Stream handler
     stream_handler = logging.StreamHandler()
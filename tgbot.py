@@ -1,8 +1,29 @@
 import asyncio
+import atexit
+import logging
+import threading
+import weakref
+from collections import deque
+from concurrent.futures import Future
+from operator import itemgetter
+from typing import Callable, Iterable, List, Optional
 from telegram import Update, Bot
 from telegram.ext import Application, CommandHandler, MessageHandler, filters, ContextTypes
 from telegram.request import HTTPXRequest
 
+logger = logging.getLogger(__name__)
+
+# Batching bots still alive; anything they have queued is sent at interpreter exit
+_BATCHING_BOTS = weakref.WeakSet()
+
+@atexit.register
+def _close_batching_bots():
+    for bot in list(_BATCHING_BOTS):
+        try:
+            bot.close()
+        except Exception as e:
+            logger.error(f"Failed to send queued Telegram messages at exit: {str(e)}")
+
 class TelegramBot:
     """
     Telegram Bot framework for sending notifications.
@@ -13,7 +34,11 @@ class TelegramBot:
     not receiving or responding to incoming messages.
     """
 
-    def __init__(self, token: str = None, chat_id: str = None, proxy: str = None):
+    # Telegram's sendMessage text limit
+    MAX_MESSAGE_LENGTH = 4096
+
+    def __init__(self, token: str = None, chat_id: str = None, proxy: str = None,
+                 batch_window: Optional[float] = None):
         """
         Initialize the TelegramBot.
 
@@ -24,6 +49,10 @@ class TelegramBot:
                 "http://host:port". Default None = direct connection. Useful when the host's
                 direct route to Telegram is blocked (some datacenters) but other networks work;
                 route Telegram traffic through a proxy/WARP while leaving everything else direct.
+            batch_window: Optional coalescing delay in seconds (e.g. 0.05). When set,
+                send_message returns immediately and messages queued within the window
+                are joined with newlines into as few sendMessage calls as the 4096-char
+                limit allows. Default None = one blocking send per message.
 
         Note: The current implementation only initializes the bot for sending messages.
         Message receiving functionality is not implemented yet.
@@ -32,6 +61,18 @@ class TelegramBot:
         self.token = token
         self.chat_id = chat_id
         self.proxy = proxy
+        self.batch_window = batch_window
+
+        # Reused across sends so the HTTP connection pool stays warm
+        self._bot = None
+        self._loop = None
+        self._loop_thread = None
+        self._loop_lock = threading.Lock()
+
+        # Coalescing state; only touched from the event loop thread
+        self._pending = deque()
+        self._flush_handle = None
+        self._flush_task = None
 
         if not self.token:
             raise ValueError("Telegram Bot token not provided and TELEGRAM_BOT_TOKEN not found in environment variables")
@@ -39,6 +80,33 @@ class TelegramBot:
         if not self.chat_id:
             raise ValueError("Telegram chat ID not provided and TELEGRAM_CHAT_ID not found in environment variables")
 
+        if self.batch_window is not None:
+            _BATCHING_BOTS.add(self)
+
+    @classmethod
+    def batch_messages(cls, items: Iterable, key: Optional[Callable] = None) -> List[list]:
+        """
+        Group items in order so each group's messages, joined with newlines, fit in
+        one sendMessage. A message longer than MAX_MESSAGE_LENGTH gets a group of its own.
+
+        Args:
+            items: Messages, or entries holding one if key is given
+            key: Optional function returning the message of an entry
+        """
+        batches = []
+        batch = []
+        length = 0
+        for item in items:
+            message = item if key is None else key(item)
+            if batch and length + 1 + len(message) > cls.MAX_MESSAGE_LENGTH:
+                batches.append(batch)
+                batch = []
+            length = length + 1 + len(message) if batch else len(message)
+            batch.append(item)
+        if batch:
+            batches.append(batch)
+        return batches
+
     def _build_bot(self) -> Bot:
         """Build a Bot, routing requests through self.proxy when set (else direct)."""
         if self.proxy:
@@ -53,14 +121,98 @@ class TelegramBot:
         This is part of the message sending functionality. Message receiving
         is not implemented.
         """
-        bot = self._build_bot()
-        await bot.send_message(chat_id=self.chat_id, text=message)
+        if self._bot is None:
+            self._bot = self._build_bot()
+        # Idempotent; without it Bot.shutdown() in close() skips closing the HTTP client
+        await self._bot.initialize()
+        await self._bot.send_message(chat_id=self.chat_id, text=message)
     
-    def send_message(self, message: str):
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        """Start the background event loop thread on first use and return its loop."""
+        with self._loop_lock:
+            if self._loop is None or self._loop.is_closed():
+                self._loop = asyncio.new_event_loop()
+                self._loop_thread = threading.Thread(
+                    target=self._loop.run_forever, name="TelegramBot-loop", daemon=True
+                )
+                self._loop_thread.start()
+            return self._loop
+
+    def send_message(self, message: str) -> Optional[Future]:
         """
         Sends a Telegram message to the default chat_id.
         
         This is the main public method for sending messages. The bot currently
         only supports sending messages, not receiving them.
+
+        The send runs on a persistent background event loop, so the Bot's
+        connection pool is reused. Without batch_window this call blocks until
+        the send completes; with batch_window it queues the message and returns
+        a Future that resolves once the batch containing it has been sent.
         """
-        asyncio.run(self._send_message_async(message))
\ No newline at end of file
+        loop = self._ensure_loop()
+        if self.batch_window is None:
+            asyncio.run_coroutine_threadsafe(self._send_message_async(message), loop).result()
+            return None
+
+        future = Future()
+        loop.call_soon_threadsafe(self._enqueue_message, message, future)
+        return future
+
+    def _enqueue_message(self, message: str, future: Future):
+        """Queue a message for the next batch and arm the flush timer (loop thread only)."""
+        self._pending.append((message, future))
+        flushing = self._flush_task is not None and not self._flush_task.done()
+        if self._flush_handle is None and not flushing:
+            self._flush_handle = self._loop.call_later(self.batch_window, self._start_flush)
+
+    def _start_flush(self):
+        """Flush timer callback: start sending the queued batch."""
+        self._flush_handle = None
+        self._flush_task = self._loop.create_task(self._flush())
+
+    async def _flush(self):
+        """Send queued messages in order, joining as many as fit in one sendMessage."""
+        while self._pending:
+            entries = []
+            while self._pending:
+                entry = self._pending.popleft()
+                # Skip messages whose Future the caller already cancelled
+                if entry[1].set_running_or_notify_cancel():
+                    entries.append(entry)
+
+            for batch in self.batch_messages(entries, key=itemgetter(0)):
+                try:
+                    await self._send_message_async("\n".join(message for message, _ in batch))
+                except Exception as e:
+                    logger.error(f"Failed to send batch of {len(batch)} Telegram message(s): {str(e)}")
+                    for _, future in batch:
+                        future.set_exception(e)
+                else:
+                    for _, future in batch:
+                        future.set_result(None)
+
+    async def _drain(self):
+        """Send everything still queued, including messages waiting on the flush timer."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        if self._flush_task is not None:
+            await self._flush_task
+        await self._flush()
+
+    def close(self):
+        """Send any queued messages, shut down the Bot's HTTP client and stop the background event loop."""
+        with self._loop_lock:
+            loop = self._loop
+            if loop is None or loop.is_closed():
+                return
+            asyncio.run_coroutine_threadsafe(self._drain(), loop).result()
+            if self._bot is not None:
+                asyncio.run_coroutine_threadsafe(self._bot.shutdown(), loop).result()
+                self._bot = None
+            loop.call_soon_threadsafe(loop.stop)
+            self._loop_thread.join()
+            loop.close()
+            self._loop = None
+            self._loop_thread = None